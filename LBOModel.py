@@ -1,8 +1,269 @@
 import pandas as pd
 import numpy as np
-import numpy_financial as npf
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernel runs as plain Python/NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from joblib import Memory, Parallel, delayed
+    _memory = Memory(location='.lbo_cache', verbose=0)
+except ImportError:
+    # joblib is optional; without it projections are recomputed each run
+    # and grid sweeps run sequentially
+    _memory = None
+    Parallel = delayed = None
+
+# Field names for the tuple of arrays returned by _project_kernel, in order
+_PROJECTION_FIELDS = (
+    'revenue', 'ebitda_margin', 'ebitda', 'depreciation', 'ebit',
+    'interest_expense', 'ebt', 'tax', 'net_income', 'wc_change', 'capex',
+    'debt_amortization', 'fcf', 'lfcf', 'debt_balance',
+)
+
+
+def _make_projection_kernel(fixed_num_years=None):
+    """
+    Build the compiled projection kernel: scalar parameters in, yearly arrays
+    out, as a tuple ordered like _PROJECTION_FIELDS. The kernel takes only
+    plain floats/ints so Numba can compile it in nopython mode.
+
+    With fixed_num_years set, Numba folds the closed-over year count into the
+    compiled code as a constant - loop bounds and array shapes become
+    literals it can unroll and inline - while the num_years argument is
+    ignored. With the default None the kernel stays fully generic.
+
+    Deliberately not cache=True: every kernel this factory mints shares the
+    same source location, so Numba's on-disk cache would key them all to one
+    index file and corrupt it as different variants are compiled across
+    processes, crashing later runs when a poisoned entry is loaded back.
+    Compilation stays lazy, so only the variants a process actually uses are
+    built.
+    """
+    @njit
+    def _project_kernel(revenue_entry, revenue_growth, ebitda_margin_entry,
+                        ebitda_margin_exit, capex_percent, dso, dpo, dsi,
+                        debt_amount, interest_rate, amortization_years, tax_rate,
+                        num_years):
+        n = num_years if fixed_num_years is None else fixed_num_years
+        idx = np.arange(n)
+
+        # Income statement: compound growth via a running product rather than
+        # n exponentiations
+        growth_factors = np.full(n, 1.0 + revenue_growth)
+        growth_factors[0] = 1.0
+        revenue = revenue_entry * np.cumprod(growth_factors)
+        margin_growth = (ebitda_margin_exit - ebitda_margin_entry) / (n - 1)
+        ebitda_margin = ebitda_margin_entry + margin_growth * idx
+        ebitda = revenue * ebitda_margin
+        depreciation = revenue * capex_percent * 0.8  # 80% of capex
+        ebit = ebitda - depreciation
+
+        # Debt schedule (straight-line paydown floored at zero; no payment in year 0)
+        annual_payment = debt_amount / amortization_years
+        debt_balance = np.maximum(0.0, debt_amount - annual_payment * idx)
+        debt_amortization = np.empty(n)
+        debt_amortization[0] = 0.0
+        debt_amortization[1:] = debt_balance[1:] - debt_balance[:-1]
+        interest_expense = debt_balance * interest_rate
+
+        ebt = ebit - interest_expense
+        tax = np.maximum(0.0, ebt * tax_rate)  # No tax benefit if EBT negative
+        net_income = ebt - tax
+
+        # Cash flow: working capital change from DSO/DPO/DSI on the revenue delta
+        revenue_diff = np.empty(n)
+        revenue_diff[0] = 0.0
+        revenue_diff[1:] = revenue[1:] - revenue[:-1]
+        wc_change = revenue_diff * ((dpo - dso - dsi) / 365.0)
+        capex = -revenue * capex_percent
+
+        # Fused FCF/LFCF pass: one loop, no intermediate temporaries from the
+        # chained Series/array adds (the loop compiles to straight-line code)
+        fcf = np.empty(n)
+        lfcf = np.empty(n)
+        for i in range(n):
+            fcf[i] = net_income[i] + depreciation[i] + wc_change[i] + capex[i]
+            lfcf[i] = fcf[i] + debt_amortization[i] - interest_expense[i]
+
+        return (revenue, ebitda_margin, ebitda, depreciation, ebit,
+                interest_expense, ebt, tax, net_income, wc_change, capex,
+                debt_amortization, fcf, lfcf, debt_balance)
+
+    return _project_kernel
+
+
+_project_kernel = _make_projection_kernel()
+
+# Specialized kernels for typical LBO horizons; _project dispatches on the
+# model's year count and falls back to the generic kernel for other sizes.
+# Each variant compiles lazily on first use within a process.
+_specialized_kernels = {n: _make_projection_kernel(n) for n in range(3, 11)}
+
+
+def _project(revenue_entry, revenue_growth, ebitda_margin_entry, ebitda_margin_exit,
+             capex_percent, dso, dpo, dsi, debt_amount, interest_rate,
+             amortization_years, tax_rate, num_years):
+    """
+    Project the full LBO operating model as a pure function of its parameters.
+
+    Returns a dict of NumPy arrays (one entry per year, along the last axis)
+    covering the income statement, cash flow and debt schedule. Keeping this
+    free of any LBOModel state lets sensitivity sweeps re-run the projection
+    with perturbed parameters without rebuilding a model object per point.
+
+    revenue_growth and ebitda_margin_exit may be arrays (any shape) to sweep
+    several points at once, producing (k, num_years) outputs. Each point runs
+    through the compiled _project_kernel.
+
+    Arrays are returned as float32 - ample precision for $-millions line
+    items at half the memory of float64. IRR solving stays in float64
+    downstream (see _fast_irr) to keep the root-finding accurate.
+    """
+    growth = np.asarray(revenue_growth, dtype=float)
+    margin_exit = np.asarray(ebitda_margin_exit, dtype=float)
+    kernel = _specialized_kernels.get(int(num_years), _project_kernel)
+
+    def run(g, m):
+        return kernel(
+            float(revenue_entry), g, float(ebitda_margin_entry), m,
+            float(capex_percent), float(dso), float(dpo), float(dsi),
+            float(debt_amount), float(interest_rate),
+            float(amortization_years), float(tax_rate), int(num_years))
+
+    if growth.ndim == 0 and margin_exit.ndim == 0:
+        return {name: array.astype(np.float32)
+                for name, array in zip(_PROJECTION_FIELDS,
+                                       run(float(growth), float(margin_exit)))}
+
+    # Sweep: one kernel call per point, stacked into (k, num_years) arrays
+    growths, margins = np.broadcast_arrays(growth.reshape(-1), margin_exit.reshape(-1))
+    points = [run(g, m) for g, m in zip(growths, margins)]
+    return {name: np.stack(arrays).astype(np.float32)
+            for name, arrays in zip(_PROJECTION_FIELDS, zip(*points))}
+
+
+def _fast_irr(cash_flows, tol=1e-10, max_iter=50):
+    """
+    IRR via Newton's method on the NPV polynomial, with a bisection fallback.
+
+    Much cheaper than npf.irr's companion-matrix eigenvalue solve for the
+    short cash-flow vectors an LBO produces (equity out, LFCF in, exit value
+    in). A single sign change in the flows guarantees a unique IRR above -1;
+    Newton usually reaches it in a few iterations from the two-flow
+    closed-form seed, but high-leverage flows can push an unguarded iterate
+    below rate = -1, so iterates are clamped to the valid domain, convergence
+    is verified via |NPV| before a result is accepted, and any row Newton
+    fails on is re-solved by bisection. Accepts one cash-flow vector or a
+    (batch, n) matrix; returns a scalar or 1D array, NaN where no root
+    exists above -1.
+    """
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    n = cf.shape[1] - 1
+    periods = np.arange(n + 1)
+    floor = -1.0 + 1e-9
+    # NPV is in the cash flows' units, so scale the acceptance threshold
+    npv_tol = tol * np.abs(cf).max(axis=1)
+
+    def npv(rate):
+        return (cf / (1.0 + rate)[:, None] ** periods).sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Seed from the two-flow closed form (exit over entry, annualized);
+        # rows whose final flow is not positive get a neutral seed
+        ratio = cf[:, -1] / -cf[:, 0]
+        rate = np.where(ratio > 0, np.abs(ratio) ** (1.0 / n) - 1.0, 0.0)
+        for _ in range(max_iter):
+            value = npv(rate)
+            converged = np.abs(value) < npv_tol
+            if converged.all():
+                break
+            discount = (1.0 + rate)[:, None] ** periods
+            derivative = -(periods * cf / discount).sum(axis=1) / (1.0 + rate)
+            step = np.where(converged, 0.0, value / derivative)
+            rate = np.maximum(rate - step, floor)
+        converged = np.abs(npv(rate)) < npv_tol
+
+        # Bisection fallback: NPV runs from +inf just above -1 down to the
+        # (negative) entry flow as rate grows, so the root brackets cleanly
+        for i in np.flatnonzero(~converged):
+            def row_npv(r):
+                return (cf[i] / (1.0 + r) ** periods).sum()
+
+            lo, hi = floor, 1.0
+            while row_npv(hi) > 0 and hi < 1e12:
+                hi *= 2.0
+            if not (row_npv(lo) > 0 >= row_npv(hi)):
+                rate[i] = np.nan  # no IRR above -1 for this row
+                continue
+            for _ in range(100):
+                mid = 0.5 * (lo + hi)
+                if row_npv(mid) > 0:
+                    lo = mid
+                else:
+                    hi = mid
+            rate[i] = 0.5 * (lo + hi)
+
+    return rate[0] if np.ndim(cash_flows) == 1 else rate
+
+
+# Folded into every disk-cache key. joblib.Memory only hashes
+# _build_from_params' own source, so edits to _project or the kernels would
+# otherwise keep serving stale .lbo_cache entries - bump this on any change
+# to the projection's numerical behavior.
+_CACHE_VERSION = 2
+
+
+def _build_from_params(params, cache_version=_CACHE_VERSION):
+    """
+    Projection for a single parameter tuple, memoized to disk when joblib is
+    available. Re-running a script (or revisiting a sweep point) with the same
+    parameters loads the cached arrays from .lbo_cache instead of recomputing.
+    Callers round floating-point parameters before keying (see _round_params)
+    so equal-up-to-noise inputs hit the same cache entry; cache_version is part
+    of the key, so bumping _CACHE_VERSION retires entries computed by older
+    projection code.
+    """
+    return _project(*params)
+
+
+if _memory is not None:
+    _build_from_params = _memory.cache(_build_from_params)
+
+
+def _round_params(params, ndigits=9):
+    """Round float parameters onto a fixed grid for stable cache keys."""
+    return tuple(round(p, ndigits) if isinstance(p, float) else p for p in params)
+
+
+def _grid_point(revenue_entry, revenue_growth, ebitda_margin_entry,
+                ebitda_margin_exit, capex_percent, dso, dpo, dsi, debt_amount,
+                equity_amount, interest_rate, amortization_years, tax_rate,
+                num_years, multiples):
+    """
+    IRR (%) and MOIC across exit multiples for one growth/margin grid point.
+
+    Module-level (and built only from plain scalars/arrays) so joblib can
+    pickle it out to worker processes.
+    """
+    projection = _project(revenue_entry, revenue_growth, ebitda_margin_entry,
+                          ebitda_margin_exit, capex_percent, dso, dpo, dsi,
+                          debt_amount, interest_rate, amortization_years,
+                          tax_rate, num_years)
+    exit_equity_values = (projection['ebitda'][-1] * multiples -
+                          projection['debt_balance'][-1])
+    cash_flows = np.empty((len(multiples), num_years))
+    cash_flows[:, 0] = -equity_amount
+    cash_flows[:, 1:-1] = projection['lfcf'][1:-1]
+    cash_flows[:, -1] = exit_equity_values
+    return _fast_irr(cash_flows) * 100, exit_equity_values / equity_amount
+
 
 class LBOModel:
     def __init__(self, company_name, entry_year, exit_year, revenue_entry, ebitda_margin_entry, 
@@ -65,164 +326,138 @@ class LBOModel:
         self.debt_amount = self.purchase_price * self.debt_percentage
         self.equity_amount = self.purchase_price - self.debt_amount
         
-        # Create timeline
-        self.years = list(range(self.entry_year, self.exit_year + 1))
+        # Create timeline; a RangeIndex gives O(1) positional year lookups
+        # without the hash table a materialized integer index needs
+        self.years = pd.RangeIndex(self.entry_year, self.exit_year + 1)
         self.num_years = len(self.years)
-        
+
+        # Run the projection once; the _build_* methods wrap its arrays in DataFrames
+        self._projection = self._project_with_params()
+
+    def _project_with_params(self, revenue_growth=None, ebitda_margin_exit=None):
+        """Run _project with this model's parameters, optionally overriding a few."""
+        params = (
+            self.revenue_entry,
+            self.revenue_growth if revenue_growth is None else revenue_growth,
+            self.ebitda_margin_entry,
+            self.ebitda_margin_exit if ebitda_margin_exit is None else ebitda_margin_exit,
+            self.capex_percent, self.dso, self.dpo, self.dsi,
+            self.debt_amount, self.interest_rate, self.amortization_years,
+            self.tax_rate, self.num_years)
+        # Single points go through the (optionally disk-cached) wrapper;
+        # batched sweep arrays are projected directly
+        if np.ndim(params[1]) == 0 and np.ndim(params[3]) == 0:
+            return _build_from_params(_round_params(params), _CACHE_VERSION)
+        return _project(*params)
+
     def _build_income_statement(self):
         """Build projected income statement."""
-        self.income_stmt = pd.DataFrame(index=self.years)
-        
-        # Revenue projection
-        self.income_stmt['Revenue'] = self.revenue_entry * (1 + self.revenue_growth) ** np.arange(self.num_years)
-        
-        # EBITDA projection (linearly interpolate margin from entry to exit)
-        margin_growth = (self.ebitda_margin_exit - self.ebitda_margin_entry) / (self.num_years - 1)
-        self.income_stmt['EBITDA Margin'] = self.ebitda_margin_entry + margin_growth * np.arange(self.num_years)
-        self.income_stmt['EBITDA'] = self.income_stmt['Revenue'] * self.income_stmt['EBITDA Margin']
-        
-        # Depreciation (simplified as % of capex)
-        self.income_stmt['Depreciation'] = self.income_stmt['Revenue'] * self.capex_percent * 0.8  # 80% of capex
-        
-        # EBIT
-        self.income_stmt['EBIT'] = self.income_stmt['EBITDA'] - self.income_stmt['Depreciation']
-        
-        # Calculate remaining debt for each year to determine interest expense
-        remaining_debt = [self.debt_amount]
-        annual_payment = self.debt_amount / self.amortization_years
-        
-        for i in range(1, self.num_years):
-            new_debt = max(0, remaining_debt[-1] - annual_payment)
-            remaining_debt.append(new_debt)
-        
-        # Interest expense based on remaining debt
-        self.income_stmt['Interest Expense'] = [debt * self.interest_rate for debt in remaining_debt]
-        
-        # EBT and Net Income
-        self.income_stmt['EBT'] = self.income_stmt['EBIT'] - self.income_stmt['Interest Expense']
-        self.income_stmt['Tax'] = self.income_stmt['EBT'].apply(lambda x: max(0, x * self.tax_rate))  # No tax benefit if EBT negative
-        self.income_stmt['Net Income'] = self.income_stmt['EBT'] - self.income_stmt['Tax']
-        
+        # Construct the DataFrame in one shot from the projection arrays;
+        # column-by-column assignment would re-align the index on every column
+        p = self._projection
+        self.income_stmt = pd.DataFrame({
+            'Revenue': p['revenue'],
+            'EBITDA Margin': p['ebitda_margin'],
+            'EBITDA': p['ebitda'],
+            'Depreciation': p['depreciation'],
+            'EBIT': p['ebit'],
+            'Interest Expense': p['interest_expense'],
+            'EBT': p['ebt'],
+            'Tax': p['tax'],
+            'Net Income': p['net_income'],
+        }, index=self.years)
+
     def _build_cash_flow(self):
         """Build projected cash flow statement."""
-        self.cash_flow = pd.DataFrame(index=self.years)
-        
-        # Start with net income
-        self.cash_flow['Net Income'] = self.income_stmt['Net Income']
-        
-        # Add back non-cash items
-        self.cash_flow['D&A'] = self.income_stmt['Depreciation']
-        
-        # Changes in working capital based on DSO/DPO/DSI
-        revenue_diff = self.income_stmt['Revenue'].diff().fillna(0)
-        
-        # Simplified working capital calculation
-        # Accounts Receivable change: (Revenue * DSO/365) delta
-        # Inventory change: (Revenue * DSI/365) delta
-        # Accounts Payable change: (Revenue * DPO/365) delta
-        ar_change = revenue_diff * self.dso / 365
-        inv_change = revenue_diff * self.dsi / 365
-        ap_change = revenue_diff * self.dpo / 365
-        
-        # Net working capital change (negative means cash outflow)
-        self.cash_flow['ΔWC'] = ap_change - (ar_change + inv_change)
-        
-        # Capital expenditures
-        self.cash_flow['Capex'] = -self.income_stmt['Revenue'] * self.capex_percent
-        
-        # Debt amortization - Fixed to avoid circular reference
-        annual_debt_payment = self.debt_amount / self.amortization_years
-        debt_amortization = []
-        remaining_debt = self.debt_amount
-        
-        for i in range(self.num_years):
-            if i == 0:
-                # No debt payment in year 0 (acquisition year)
-                debt_amortization.append(0)
-            else:
-                # Calculate debt payment for this year
-                payment = min(annual_debt_payment, remaining_debt)
-                debt_amortization.append(-payment)
-                remaining_debt -= payment
-        
-        self.cash_flow['Debt Amortization'] = debt_amortization
-        
-        # Interest payments
-        self.cash_flow['Interest Paid'] = -self.income_stmt['Interest Expense']
-        
-        # Calculate free cash flow
-        self.cash_flow['FCF'] = (self.cash_flow['Net Income'] + 
-                                self.cash_flow['D&A'] + 
-                                self.cash_flow['ΔWC'] + 
-                                self.cash_flow['Capex'])
-        
-        # Levered free cash flow (after debt service)
-        self.cash_flow['LFCF'] = (self.cash_flow['FCF'] + 
-                                 self.cash_flow['Debt Amortization'] + 
-                                 self.cash_flow['Interest Paid'])
-        
-        # Cumulative FCF
-        self.cash_flow['Cumulative FCF'] = self.cash_flow['LFCF'].cumsum()
-        
+        p = self._projection
+        self.cash_flow = pd.DataFrame({
+            'Net Income': p['net_income'],
+            'D&A': p['depreciation'],
+            'WC Change': p['wc_change'],
+            'Capex': p['capex'],
+            'Debt Amortization': p['debt_amortization'],
+            'Interest Paid': -p['interest_expense'],
+            'FCF': p['fcf'],
+            'LFCF': p['lfcf'],
+            'Cumulative FCF': np.cumsum(p['lfcf']),
+        }, index=self.years)
+
     def _build_balance_sheet(self):
         """Build projected balance sheet."""
-        self.balance_sheet = pd.DataFrame(index=self.years)
-        
-        # Debt balance - Calculate based on debt amortization from cash flow
-        debt_balance = [self.debt_amount]
-        for i in range(1, self.num_years):
-            debt_payment = -self.cash_flow.loc[self.years[i], 'Debt Amortization']
-            new_balance = debt_balance[-1] - debt_payment
-            debt_balance.append(new_balance)
-        
-        self.balance_sheet['Debt'] = debt_balance
-        
-        # Equity (starting equity + retained earnings)
-        self.balance_sheet['Equity'] = self.equity_amount + self.cash_flow['Cumulative FCF']
-        
-        # Enterprise value (simplified as debt + equity)
-        self.balance_sheet['Enterprise Value'] = self.balance_sheet['Debt'] + self.balance_sheet['Equity']
-        
-        # Implied EV/EBITDA multiple
-        self.balance_sheet['Implied EV/EBITDA'] = (self.balance_sheet['Enterprise Value'] / 
-                                                  self.income_stmt['EBITDA'])
+        p = self._projection
+        cumulative_fcf = self.cash_flow['Cumulative FCF'].to_numpy()
+        debt = p['debt_balance']
+        # Equity is starting equity plus retained earnings; enterprise value is
+        # simplified as debt + equity
+        equity = self.equity_amount + cumulative_fcf
+        enterprise_value = debt + equity
+        self.balance_sheet = pd.DataFrame({
+            'Debt': debt,
+            'Equity': equity,
+            'Enterprise Value': enterprise_value,
+            'Implied EV/EBITDA': enterprise_value / p['ebitda'],
+        }, index=self.years)
         
     def _calculate_returns(self):
         """Calculate IRR, MOIC and other return metrics for the LBO."""
-        # Cash flows (negative equity at entry, positive at exit)
-        cash_flows = [-self.equity_amount]
-        
-        # Add intermediate cash flows (dividends, etc.)
-        for year in range(self.entry_year + 1, self.exit_year):
-            year_idx = year - self.entry_year
-            cash_flows.append(self.cash_flow.loc[year, 'LFCF'])
-        
+        # Grab the LFCF column as a plain array; positional indexing avoids a
+        # label lookup per year
+        lfcf = self.cash_flow['LFCF'].to_numpy()
+
         # Calculate exit value
-        exit_ebitda = self.income_stmt.loc[self.exit_year, 'EBITDA']
+        exit_ebitda = self.income_stmt['EBITDA'].iat[-1]
         exit_multiple = self.purchase_price_multiple  # Same as entry for simplicity
         exit_enterprise_value = exit_ebitda * exit_multiple
-        
+
         # Net debt at exit
-        net_debt = self.balance_sheet.loc[self.exit_year, 'Debt']
-        
+        net_debt = self.balance_sheet['Debt'].iat[-1]
+
         # Equity value at exit
         exit_equity_value = exit_enterprise_value - net_debt
-        
-        # Final cash flow
-        cash_flows.append(exit_equity_value)
-        
-        # Calculate IRR using numpy_financial
-        self.irr = npf.irr(cash_flows) * 100  # as percentage
+
+        # Cash flows (negative equity at entry, intermediate LFCF, exit value)
+        cash_flows = [-self.equity_amount, *lfcf[1:-1].tolist(), exit_equity_value]
+
+        # Calculate IRR via the Newton solver
+        self.irr = _fast_irr(cash_flows) * 100  # as percentage
         
         # Calculate MOIC (Multiple on Invested Capital)
         self.moic = exit_equity_value / self.equity_amount
         
         # Calculate DPI (Distributions to Paid-In)
-        self.dpi = sum(max(0, cf) for cf in cash_flows[1:]) / self.equity_amount
+        distributions = np.asarray(cash_flows[1:])
+        self.dpi = distributions.clip(min=0).sum() / self.equity_amount
         
         # Calculate TVPI (Total Value to Paid-In)
         self.tvpi = self.moic  # Same as MOIC in this simple model
-        
+
+        # Cache exit-year scalars; summary and sensitivity_analysis reuse
+        # these instead of re-indexing the DataFrames on every access
+        self._exit_ebitda = float(exit_ebitda)
+        self._exit_debt = float(net_debt)
+        self._exit_margin = float(self.income_stmt['EBITDA Margin'].iat[-1])
+
+    def _returns_from_projection(self, projection):
+        """
+        Calculate IRR (%) and MOIC arrays implied by a projection from _project.
+
+        Handles both a single projection and a broadcast sweep (leading axis);
+        always returns 1D arrays, one entry per sweep point.
+        """
+        exit_equity_values = np.atleast_1d(
+            projection['ebitda'][..., -1] * self.purchase_price_multiple -
+            projection['debt_balance'][..., -1])
+        lfcf = np.broadcast_to(projection['lfcf'],
+                               (len(exit_equity_values), self.num_years))
+        # One cash-flow row per sweep point; _fast_irr solves the whole batch
+        cash_flows = np.empty_like(lfcf)
+        cash_flows[:, 0] = -self.equity_amount
+        cash_flows[:, 1:-1] = lfcf[:, 1:-1]
+        cash_flows[:, -1] = exit_equity_values
+        irrs = _fast_irr(cash_flows) * 100
+        moics = exit_equity_values / self.equity_amount
+        return irrs, moics
+
     def summary(self):
         """Print summary of the LBO model."""
         print(f"\nLBO Model Summary for {self.company_name}")
@@ -237,9 +472,8 @@ class LBOModel:
         print(f"  - Equity: ${self.equity_amount:,.2f}M ({(1-self.debt_percentage)*100:.1f}%)")
         
         print("\nExit Metrics:")
-        exit_ebitda = self.income_stmt.loc[self.exit_year, 'EBITDA']
-        print(f"Exit EBITDA: ${exit_ebitda:,.2f}M")
-        print(f"Exit EBITDA Margin: {self.income_stmt.loc[self.exit_year, 'EBITDA Margin']*100:.1f}%")
+        print(f"Exit EBITDA: ${self._exit_ebitda:,.2f}M")
+        print(f"Exit EBITDA Margin: {self._exit_margin*100:.1f}%")
         
         print("\nReturns:")
         print(f"IRR: {self.irr:.1f}%")
@@ -249,6 +483,10 @@ class LBOModel:
         
     def visualize(self):
         """Create visualizations of key metrics."""
+        # Imported here so headless workflows (sensitivity sweeps, tests)
+        # don't pay matplotlib's import cost
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(15, 10))
         
         # Revenue and EBITDA growth
@@ -285,6 +523,13 @@ class LBOModel:
         plt.tight_layout()
         plt.show()
         
+    def _default_sweeps(self):
+        """Default +/-2 sweep ranges around the base-case assumptions."""
+        exit_multiples = [self.purchase_price_multiple + d for d in (-2, -1, 0, 1, 2)]
+        revenue_growths = [self.revenue_growth * 100 + d for d in (-2, -1, 0, 1, 2)]
+        ebitda_margins = [self.ebitda_margin_exit * 100 + d for d in (-2, -1, 0, 1, 2)]
+        return exit_multiples, revenue_growths, ebitda_margins
+
     def sensitivity_analysis(self, exit_multiples=None, revenue_growths=None, ebitda_margins=None):
         """
         Perform sensitivity analysis on key variables.
@@ -294,96 +539,83 @@ class LBOModel:
         - revenue_growths: List of revenue growth rates to test
         - ebitda_margins: List of exit EBITDA margins to test
         """
+        default_multiples, default_growths, default_margins = self._default_sweeps()
         if exit_multiples is None:
-            exit_multiples = [self.purchase_price_multiple - 2, 
-                             self.purchase_price_multiple - 1, 
-                             self.purchase_price_multiple, 
-                             self.purchase_price_multiple + 1, 
-                             self.purchase_price_multiple + 2]
-        
+            exit_multiples = default_multiples
         if revenue_growths is None:
-            revenue_growths = [(self.revenue_growth * 100) - 2, 
-                              (self.revenue_growth * 100) - 1, 
-                              (self.revenue_growth * 100), 
-                              (self.revenue_growth * 100) + 1, 
-                              (self.revenue_growth * 100) + 2]
-        
+            revenue_growths = default_growths
         if ebitda_margins is None:
-            ebitda_margins = [(self.ebitda_margin_exit * 100) - 2, 
-                             (self.ebitda_margin_exit * 100) - 1, 
-                             (self.ebitda_margin_exit * 100), 
-                             (self.ebitda_margin_exit * 100) + 1, 
-                             (self.ebitda_margin_exit * 100) + 2]
-        
-        # Exit multiple sensitivity
+            ebitda_margins = default_margins
+
+        # Exit multiple sensitivity - closed form across the whole multiples array
+        # (two cash flows: equity out at entry, equity value back at exit)
         print("\nExit Multiple Sensitivity:")
         print("Exit Multiple\tIRR\tMOIC")
-        for multiple in exit_multiples:
-            # Calculate exit value with this multiple
-            exit_ebitda = self.income_stmt.loc[self.exit_year, 'EBITDA']
-            exit_enterprise_value = exit_ebitda * multiple
-            exit_debt = self.balance_sheet.loc[self.exit_year, 'Debt']
-            exit_equity_value = exit_enterprise_value - exit_debt
-            
-            # Calculate returns
-            moic = exit_equity_value / self.equity_amount
-            
-            # Calculate IRR
-            cash_flows = [-self.equity_amount]
-            cash_flows.append(exit_equity_value)
-            irr = npf.irr(cash_flows) * 100
-            
+        multiples = np.asarray(exit_multiples, dtype=float)
+        exit_equity_values = self._exit_ebitda * multiples - self._exit_debt
+        moics = exit_equity_values / self.equity_amount
+        # With only two flows, IRR = (exit/entry)^(1/n) - 1 in closed form -
+        # no root finding needed
+        irrs = (moics ** (1.0 / self.holding_period) - 1.0) * 100
+        for multiple, irr, moic in zip(multiples, irrs, moics):
             print(f"{multiple:.1f}x\t{irr:.1f}%\t{moic:.2f}x")
-        
-        # Revenue growth sensitivity
+
+        # Revenue growth sensitivity - one broadcast projection for the whole sweep
         print("\nRevenue Growth Sensitivity:")
         print("Growth Rate\tIRR\tMOIC")
-        for growth in revenue_growths:
-            # Create a temporary model with this growth rate
-            temp_model = LBOModel(
-                company_name=self.company_name,
-                entry_year=self.entry_year,
-                exit_year=self.exit_year,
-                revenue_entry=self.revenue_entry,
-                ebitda_margin_entry=self.ebitda_margin_entry * 100,
-                revenue_growth=growth,
-                ebitda_margin_exit=self.ebitda_margin_exit * 100,
-                capex_percent=self.capex_percent * 100,
-                dso=self.dso,
-                dpo=self.dpo,
-                dsi=self.dsi,
-                purchase_price_multiple=self.purchase_price_multiple,
-                debt_percentage=self.debt_percentage * 100,
-                interest_rate=self.interest_rate * 100,
-                amortization_years=self.amortization_years
-            )
-            
-            print(f"{growth:.1f}%\t{temp_model.irr:.1f}%\t{temp_model.moic:.2f}x")
-        
-        # EBITDA margin sensitivity
+        growths = np.asarray(revenue_growths, dtype=float)
+        projection = self._project_with_params(revenue_growth=growths[:, None] / 100)
+        irrs, moics = self._returns_from_projection(projection)
+        for growth, irr, moic in zip(growths, irrs, moics):
+            print(f"{growth:.1f}%\t{irr:.1f}%\t{moic:.2f}x")
+
+        # EBITDA margin sensitivity - one broadcast projection for the whole sweep
         print("\nEBITDA Margin Sensitivity:")
         print("Exit Margin\tIRR\tMOIC")
-        for margin in ebitda_margins:
-            # Create a temporary model with this margin
-            temp_model = LBOModel(
-                company_name=self.company_name,
-                entry_year=self.entry_year,
-                exit_year=self.exit_year,
-                revenue_entry=self.revenue_entry,
-                ebitda_margin_entry=self.ebitda_margin_entry * 100,
-                revenue_growth=self.revenue_growth * 100,
-                ebitda_margin_exit=margin,
-                capex_percent=self.capex_percent * 100,
-                dso=self.dso,
-                dpo=self.dpo,
-                dsi=self.dsi,
-                purchase_price_multiple=self.purchase_price_multiple,
-                debt_percentage=self.debt_percentage * 100,
-                interest_rate=self.interest_rate * 100,
-                amortization_years=self.amortization_years
-            )
-            
-            print(f"{margin:.1f}%\t{temp_model.irr:.1f}%\t{temp_model.moic:.2f}x")
+        margins = np.asarray(ebitda_margins, dtype=float)
+        projection = self._project_with_params(ebitda_margin_exit=margins[:, None] / 100)
+        irrs, moics = self._returns_from_projection(projection)
+        for margin, irr, moic in zip(margins, irrs, moics):
+            print(f"{margin:.1f}%\t{irr:.1f}%\t{moic:.2f}x")
+
+    def grid_sensitivity(self, exit_multiples=None, revenue_growths=None,
+                         ebitda_margins=None, n_jobs=-1):
+        """
+        Evaluate returns over the full exit-multiple x growth x margin grid.
+
+        The growth/margin points are independent model builds, so they are
+        dispatched across CPU cores with joblib.Parallel when joblib is
+        installed (sequential otherwise); exit multiples are closed-form per
+        point. Defaults match the one-dimensional sensitivity_analysis sweeps.
+
+        Returns a DataFrame with one row per grid point and columns
+        Exit Multiple, Revenue Growth, Exit EBITDA Margin, IRR, MOIC
+        (growth/margin in %, IRR in %).
+        """
+        default_multiples, default_growths, default_margins = self._default_sweeps()
+        multiples = np.asarray(default_multiples if exit_multiples is None
+                               else exit_multiples, dtype=float)
+        growths = default_growths if revenue_growths is None else revenue_growths
+        margins = default_margins if ebitda_margins is None else ebitda_margins
+
+        points = [(growth, margin) for growth in growths for margin in margins]
+        args = [(self.revenue_entry, growth / 100, self.ebitda_margin_entry,
+                 margin / 100, self.capex_percent, self.dso, self.dpo, self.dsi,
+                 self.debt_amount, self.equity_amount, self.interest_rate,
+                 self.amortization_years, self.tax_rate, self.num_years,
+                 multiples)
+                for growth, margin in points]
+        if Parallel is not None:
+            results = Parallel(n_jobs=n_jobs)(delayed(_grid_point)(*a) for a in args)
+        else:
+            results = [_grid_point(*a) for a in args]
+
+        rows = []
+        for (growth, margin), (irrs, moics) in zip(points, results):
+            for multiple, irr, moic in zip(multiples, irrs, moics):
+                rows.append((multiple, growth, margin, irr, moic))
+        return pd.DataFrame(rows, columns=['Exit Multiple', 'Revenue Growth',
+                                           'Exit EBITDA Margin', 'IRR', 'MOIC'])
 
 
 # Example usage